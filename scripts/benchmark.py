@@ -0,0 +1,68 @@
+"""In-process benchmarks for the fragment/puzzle services.
+
+Times warm-state fragment fetches and concurrent puzzle solves against the
+configured fragment server. A throwaway warmup request runs before any
+measurement so the first timed number doesn't include DNS/TCP/session setup,
+keeping results comparable across phases.
+"""
+
+import argparse
+import asyncio
+import time
+
+from puzzle_solver.clients.http_client import close_http_session
+from puzzle_solver.core.logging_config import setup_logging
+from puzzle_solver.domain.services.fragment import FragmentService
+from puzzle_solver.domain.services.puzzle import PuzzleService
+
+
+async def run_fragment_benchmarks(service: FragmentService, batch_size: int) -> None:
+    """Time a warm single-fragment fetch and a concurrent batch fetch."""
+    # Warmup: pay connection/DNS setup outside the timed region
+    await service.get_fragment(1)
+
+    start = time.perf_counter()
+    await service.get_fragment(1)
+    single = time.perf_counter() - start
+    print(f"Single fragment (warm): {single * 1000:.1f}ms")
+
+    start = time.perf_counter()
+    batch = await service.get_fragments_batch(list(range(1, batch_size + 1)))
+    elapsed = time.perf_counter() - start
+    print(f"Batch of {batch_size}: {elapsed * 1000:.1f}ms ({batch.total_found} found)")
+
+
+async def run_concurrency_test(service: PuzzleService, solves: int) -> None:
+    """Run N puzzle solves concurrently against one shared service instance."""
+    start = time.perf_counter()
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(service.solve_puzzle()) for _ in range(solves)]
+    elapsed = time.perf_counter() - start
+
+    results = [t.result() for t in tasks]
+    solo = sum(r.elapsed_seconds for r in results)
+    print(f"{solves} concurrent solves: {elapsed:.3f}s wall (sum of solo times {solo:.3f}s)")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the puzzle-solver services")
+    parser.add_argument("--batch-size", type=int, default=20, help="Fragments per batch benchmark")
+    parser.add_argument("--solves", type=int, default=5, help="Concurrent puzzle solves")
+    args = parser.parse_args()
+
+    if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+: run tasks eagerly to skip a loop round-trip
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    setup_logging()
+    fragment_service = FragmentService()
+    puzzle_service = PuzzleService(fragment_service)
+
+    try:
+        await run_fragment_benchmarks(fragment_service, args.batch_size)
+        await run_concurrency_test(puzzle_service, args.solves)
+    finally:
+        await close_http_session()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,202 @@
+"""Simple load-test harness for the puzzle-solver API.
+
+Fires --users * --requests concurrent GETs against a target endpoint and
+reports latency statistics. One aiohttp session (keep-alive, pooled) is
+shared across the whole process so auth and load requests reuse the same
+DNS cache and TCP connections.
+"""
+
+import argparse
+import asyncio
+import time
+from array import array
+from collections import Counter
+
+import aiohttp
+import numpy as np
+
+try:
+    from hdrh.histogram import HdrHistogram  # noqa
+except ImportError:
+    HdrHistogram = None  # hdrhistogram is not essential, but preferred for long runs
+
+DEFAULT_URL = "http://localhost:8000"
+
+
+async def get_auth_token(session: aiohttp.ClientSession, base_url: str, username: str, password: str) -> str:
+    """Fetch a JWT via basic auth, reusing the shared session."""
+    async with session.post(f"{base_url}/auth/token", auth=aiohttp.BasicAuth(username, password)) as resp:
+        resp.raise_for_status()
+        data = await resp.json()
+        return data["access_token"]
+
+
+class LoadTestRunner:
+    """Runs the load test and aggregates per-request results."""
+
+    def __init__(self, session: aiohttp.ClientSession, base_url: str, endpoint: str, token: str | None = None) -> None:
+        self.session = session
+        self.base_url = base_url
+        self.endpoint = endpoint
+        self.headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    async def make_request(self) -> dict:
+        """Issue one GET and record status plus elapsed time."""
+        start = time.perf_counter()
+        try:
+            async with self.session.get(f"{self.base_url}{self.endpoint}", headers=self.headers) as resp:
+                await resp.read()
+                return {"status": resp.status, "elapsed": time.perf_counter() - start}
+        except Exception as e:
+            # guardrail: Record failed requests instead of aborting the run
+            return {"status": 0, "elapsed": time.perf_counter() - start, "error": str(e)}
+
+    async def warmup(self, count: int) -> None:
+        """Pre-establish connections so timing excludes TCP/TLS setup."""
+        await asyncio.gather(*[self.make_request() for _ in range(count)])
+
+    async def run_load_test(self, users: int, requests_per_user: int) -> dict:
+        """Fire all requests concurrently, folding results into rolling stats.
+
+        Results are consumed via as_completed, so completed request dicts are
+        freed immediately instead of being retained until the slowest finishes.
+        Memory stays constant regardless of --users * --requests.
+        """
+        tasks = [asyncio.ensure_future(self.make_request()) for _ in range(users) for _ in range(requests_per_user)]
+        stats = StreamingStats()
+        start = time.perf_counter()
+        for future in asyncio.as_completed(tasks):
+            stats.record(await future)
+        total_elapsed = time.perf_counter() - start
+        return stats.analyze(total_elapsed)
+
+
+class StreamingStats:
+    """Streaming latency accumulator with constant memory.
+
+    When hdrhistogram is installed, samples land in an HdrHistogram
+    (1µs..60s, 3 significant figures) whose size is fixed regardless of test
+    length; otherwise they collect in a compact double array reduced by one
+    vectorized NumPy pass at the end.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.status_counts: Counter[int] = Counter()
+        self.successful = 0
+        if HdrHistogram is not None:
+            self.histogram = HdrHistogram(1, 60_000_000, 3)  # microseconds
+            self.times = None
+        else:
+            self.histogram = None
+            self.times = array("d")  # 8 bytes/sample, populated during streaming
+
+    def record(self, result: dict) -> None:
+        """Fold one request result into the accumulators."""
+        self.total += 1
+        self.status_counts[result["status"]] += 1
+        if result["status"] != 200:
+            return
+        self.successful += 1
+        if self.histogram is not None:
+            self.histogram.record_value(max(1, int(result["elapsed"] * 1e6)))
+        else:
+            self.times.append(result["elapsed"])
+
+    def analyze(self, total_elapsed: float) -> dict:
+        """Finalize the accumulators into the report dict."""
+        analysis = {
+            "total_requests": self.total,
+            "successful": self.successful,
+            "total_elapsed": total_elapsed,
+            "requests_per_second": self.total / total_elapsed if total_elapsed > 0 else 0.0,
+            "status_counts": dict(self.status_counts),
+        }
+        if not self.successful:
+            return analysis
+        if self.histogram is not None:
+            hist = self.histogram
+            analysis.update(
+                {
+                    "mean": hist.get_mean_value() / 1e6,
+                    "median": hist.get_value_at_percentile(50) / 1e6,
+                    "p95": hist.get_value_at_percentile(95) / 1e6,
+                    "p99": hist.get_value_at_percentile(99) / 1e6,
+                    "p999": hist.get_value_at_percentile(99.9) / 1e6,
+                    "min": hist.get_min_value() / 1e6,
+                    "max": hist.get_max_value() / 1e6,
+                    "stdev": hist.get_stddev() / 1e6,
+                }
+            )
+        else:
+            samples = np.frombuffer(self.times, dtype=np.float64)
+            p50, p95, p99, p999 = np.percentile(samples, [50, 95, 99, 99.9])
+            analysis.update(
+                {
+                    "mean": float(samples.mean()),
+                    "median": float(p50),
+                    "p95": float(p95),
+                    "p99": float(p99),
+                    "p999": float(p999),
+                    "min": float(samples.min()),
+                    "max": float(samples.max()),
+                    "stdev": float(samples.std(ddof=1)) if len(samples) > 1 else 0.0,
+                }
+            )
+        return analysis
+
+
+def print_results(analysis: dict) -> None:
+    """Print the analysis in a human-readable form."""
+    print("=" * 50)
+    print(f"Total requests:  {analysis['total_requests']}")
+    print(f"Successful:      {analysis['successful']}")
+    print(f"Total elapsed:   {analysis['total_elapsed']:.2f}s")
+    print(f"Requests/sec:    {analysis['requests_per_second']:.1f}")
+    print(f"Status counts:   {analysis['status_counts']}")
+    if "mean" in analysis:
+        print(f"Mean latency:    {analysis['mean'] * 1000:.1f}ms")
+        print(f"Median latency:  {analysis['median'] * 1000:.1f}ms")
+        print(f"P95/P99/P99.9:   {analysis['p95'] * 1000:.1f}ms / {analysis['p99'] * 1000:.1f}ms / {analysis['p999'] * 1000:.1f}ms")
+        print(f"Min/Max:         {analysis['min'] * 1000:.1f}ms / {analysis['max'] * 1000:.1f}ms")
+        print(f"Stdev:           {analysis['stdev'] * 1000:.1f}ms")
+    print("=" * 50)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the puzzle-solver API")
+    parser.add_argument("--url", default=DEFAULT_URL, help="Base URL of the API")
+    parser.add_argument("--endpoint", default="/health", help="Endpoint to hit")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent users")
+    parser.add_argument("--requests", type=int, default=10, help="Requests per user")
+    parser.add_argument("--username", default="admin", help="Basic auth username for /auth/token")
+    parser.add_argument("--password", default="secret123", help="Basic auth password for /auth/token")
+    parser.add_argument("--auth", action="store_true", help="Fetch a JWT before the run")
+    parser.add_argument("--connector-limit", type=int, default=0, help="Total connection limit (0 = unlimited)")
+    parser.add_argument("--per-host-limit", type=int, default=0, help="Per-host connection limit (0 = unlimited)")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed warmup requests to preallocate connections")
+    args = parser.parse_args()
+
+    if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+: run tasks eagerly to skip a loop round-trip
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    connector = aiohttp.TCPConnector(
+        limit=args.connector_limit,
+        limit_per_host=args.per_host_limit,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+        force_close=False,
+    )
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        token = await get_auth_token(session, args.url, args.username, args.password) if args.auth else None
+        runner = LoadTestRunner(session, args.url, args.endpoint, token)
+        if args.warmup > 0:
+            await runner.warmup(args.warmup)
+        print(f"Running load test: {args.users} users x {args.requests} requests -> {args.url}{args.endpoint}")
+        analysis = await runner.run_load_test(args.users, args.requests)
+        print_results(analysis)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
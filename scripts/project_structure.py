@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 
@@ -19,46 +20,66 @@ def generate_folder_structure(path, exclusions, output_file):
         'tests/unit': '# Unit tests'
     }
 
+    excluded = frozenset(exclusions)
+
     def get_comment(path_parts):
         path_str = '/'.join(path_parts)
         return comments.get(path_str, '')
 
+    # Stems cached per depth so each line reuses one shared prefix string
+    stems = [""]
+
     def get_tree_prefix(is_last, level):
         if level == 0:
             return ""
-        return "│   " * (level - 1) + ("└── " if is_last else "├── ")
-
-    def write_directory_tree(f, current_path, level=0, is_last=True, path_parts=[]):
-        if level > 0:  # Skip root directory name
-            prefix = get_tree_prefix(is_last, level)
-            comment = get_comment(path_parts)
-            f.write(f"{prefix}{current_path.name}/ {comment}\n")
+        while len(stems) < level:
+            stems.append(stems[-1] + "│   ")
+        return stems[level - 1] + ("└── " if is_last else "├── ")
 
+    def scan_entries(dir_path):
+        """List one directory via scandir: (dirs, files), each sorted by name."""
         try:
-            items = sorted(current_path.iterdir(), key=lambda x: (x.is_file(), x.name.lower()))
-            dirs = [item for item in items if item.is_dir() and item.name not in exclusions]
-            files = [item for item in items if item.is_file()]
-
-            # Write directories first
-            for i, dir_path in enumerate(dirs):
-                is_last_dir = (i == len(dirs) - 1) and len(files) == 0
-                new_path_parts = path_parts + [dir_path.name]
-                write_directory_tree(f, dir_path, level + 1, is_last_dir, new_path_parts)
-
-            # Write files
-            for i, file_path in enumerate(files):
-                is_last_file = i == len(files) - 1
-                prefix = get_tree_prefix(is_last_file, level + 1)
-                f.write(f"{prefix}{file_path.name}\n")
-
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: (e.is_file(follow_symlinks=False), e.name.lower()))
         except PermissionError:
-            pass
+            return [], []
+        dirs = [e for e in entries if e.is_dir(follow_symlinks=False) and e.name not in excluded]
+        files = [e for e in entries if e.is_file(follow_symlinks=False)]
+        return dirs, files
+
+    def write_directory_tree(lines, root_path):
+        """Walk the tree iteratively (explicit stack), appending one line per entry."""
+        # Stack items: (path, level, is_last, path_parts, is_dir)
+        stack = [(root_path, 0, True, (), True)]
+        while stack:
+            current_path, level, is_last, path_parts, is_dir = stack.pop()
+
+            if not is_dir:
+                lines.append(f"{get_tree_prefix(is_last, level)}{os.path.basename(current_path)}\n")
+                continue
+
+            if level > 0:  # Skip root directory name
+                prefix = get_tree_prefix(is_last, level)
+                comment = get_comment(path_parts)
+                lines.append(f"{prefix}{os.path.basename(current_path)}/ {comment}\n")
+
+            dirs, files = scan_entries(current_path)
+
+            # Files are pushed first so the stack pops them after every
+            # subdirectory's subtree has been written
+            for i in range(len(files) - 1, -1, -1):
+                stack.append((files[i].path, level + 1, i == len(files) - 1, path_parts, False))
+            for i in range(len(dirs) - 1, -1, -1):
+                is_last_dir = (i == len(dirs) - 1) and len(files) == 0
+                stack.append((dirs[i].path, level + 1, is_last_dir, path_parts + (dirs[i].name,), True))
 
     base_path = Path(path).resolve()
 
+    lines = [f"{base_path.name}/\n"]
+    write_directory_tree(lines, str(base_path))
+
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(f"{base_path.name}/\n")
-        write_directory_tree(f, base_path, path_parts=[])
+        f.write("".join(lines))
 
 
 if __name__ == "__main__":
@@ -1,18 +1,28 @@
-import requests
+import asyncio
 
-BASE_URL = "localhost:8080/fragment"
+import aiohttp
 
+BASE_URL = "http://localhost:8080/fragment"
+FRAGMENT_COUNT = 3
 
-def fragment_endpoint_test(n: int):
+
+async def fragment_endpoint_test(session: aiohttp.ClientSession, n: int) -> None:
     url = f"{BASE_URL}?id={n}"
     print(f"→ Requesting: {url}")
-    response = requests.get(url, timeout=5)
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+        text = await response.text()
+        print(f"Status: {response.status}")
+        print(f"Response: {text}\n")
+
 
-    print(f"Status: {response.status_code}")
-    print(f"Response: {response.text}\n")
+async def main() -> None:
+    # All requests share one session and run concurrently, so total time is
+    # ~max(individual latency) instead of the sum
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        tasks = [fragment_endpoint_test(session, i) for i in range(1, FRAGMENT_COUNT + 1)]
+        await asyncio.gather(*tasks)
 
 
 if __name__ == "__main__":
-    # Test a few sample IDs
-    for i in range(1, 4):
-        fragment_endpoint_test(i)
+    asyncio.run(main())
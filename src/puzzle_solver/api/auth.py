@@ -1,31 +1,66 @@
+import time
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 
 from puzzle_solver.config.settings import settings
 
-security = HTTPBearer()
+
+class _CachedHTTPBearer(HTTPBearer):
+    """HTTPBearer that parses the Authorization header once per request.
+
+    The parsed credentials are cached on request.state so additional uses of
+    this dependency within the same request skip the header split. Only the
+    authenticated puzzle routes attach it; probe and token endpoints never
+    pay for bearer parsing.
+    """
+
+    async def __call__(self, request: Request) -> HTTPAuthorizationCredentials | None:
+        credentials = getattr(request.state, "_bearer_credentials", None)
+        if credentials is None:
+            credentials = await super().__call__(request)
+            request.state._bearer_credentials = credentials
+        return credentials
+
+
+security = _CachedHTTPBearer()
+
+# Signing parameters are fixed for the process lifetime: read settings and
+# build the algorithms tuple once instead of per call
+_SECRET = settings.JWT_SECRET_KEY
+_ALG = settings.JWT_ALGORITHM
+_ALGS = (_ALG,)
+_DEFAULT_TTL = timedelta(hours=24)
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     """Create a JWT access token."""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(UTC) + expires_delta
-    else:
-        expire = datetime.now(UTC) + timedelta(hours=24)
+    expire = datetime.now(UTC) + (expires_delta if expires_delta else _DEFAULT_TTL)
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm="HS256")
+    return jwt.encode(to_encode, _SECRET, algorithm=_ALG)
+
+
+@lru_cache(maxsize=4096)
+def _decode_token(token: str) -> tuple[str | None, float]:
+    """Decode and HMAC-verify a token once; hits are served from the cache.
+
+    Failed decodes raise and are never cached, so only valid tokens are
+    memoized. Expiry must be re-checked by the caller since cached entries
+    skip the decode-time exp validation.
+    """
+    payload = jwt.decode(token, _SECRET, algorithms=_ALGS)
+    return payload.get("sub"), float(payload.get("exp", 0))
 
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Verify JWT token and return user."""
     try:
-        payload = jwt.decode(credentials.credentials, settings.JWT_SECRET_KEY, algorithms=["HS256"])
-        username: str = payload.get("sub")
-        if username is None:
+        username, exp_epoch = _decode_token(credentials.credentials)
+        if username is None or exp_epoch <= time.time():
             raise HTTPException(status_code=401, detail="Invalid token")
         return username
     except JWTError:
@@ -0,0 +1,14 @@
+from fastapi import Request
+
+from puzzle_solver.domain.services.fragment import FragmentService
+from puzzle_solver.domain.services.puzzle import PuzzleService
+
+
+def get_fragment_service(request: Request) -> FragmentService:
+    """Return the shared FragmentService built at startup."""
+    return request.app.state.fragment_service
+
+
+def get_puzzle_service(request: Request) -> PuzzleService:
+    """Return the shared PuzzleService built at startup."""
+    return request.app.state.puzzle_service
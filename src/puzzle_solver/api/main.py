@@ -10,6 +10,7 @@ Assumptions:
 [Lumu Challenge]
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -24,20 +25,28 @@ from puzzle_solver.api.routers import auth, health, observability
 from puzzle_solver.api.v1.routers import puzzle as puzzle_v1
 from puzzle_solver.config.settings import settings
 from puzzle_solver.core.logging_config import setup_logging
+from puzzle_solver.domain.services.fragment import FragmentService
+from puzzle_solver.domain.services.puzzle import PuzzleService
 
 
-def setup_tracing():
-    """Configure OpenTelemetry tracing with OTLP."""
-    from opentelemetry.sdk.resources import Resource
-
+def _package_version() -> str:
+    """Resolve the installed package version once at import."""
     try:
         import importlib.metadata
 
-        version = importlib.metadata.version("puzzle-decoder")
+        return importlib.metadata.version("puzzle-decoder")
     except Exception:
-        version = "1.0.0"
+        return "1.0.0"
+
+
+_VERSION = _package_version()
+
+
+def setup_tracing():
+    """Configure OpenTelemetry tracing with OTLP."""
+    from opentelemetry.sdk.resources import Resource
 
-    resource = Resource.create({"service.name": "puzzle-solver", "service.version": version})
+    resource = Resource.create({"service.name": "puzzle-solver", "service.version": _VERSION})
 
     trace.set_tracer_provider(TracerProvider(resource=resource))
     otlp_exporter = OTLPSpanExporter(
@@ -50,8 +59,13 @@ def setup_tracing():
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # noqa
     # Startup
+    if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+: run tasks eagerly to skip a loop round-trip
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     setup_logging()
     setup_tracing()
+    # Shared service instances: constructed once instead of per request
+    app.state.fragment_service = FragmentService(settings.FRAGMENT_SERVICE)
+    app.state.puzzle_service = PuzzleService(app.state.fragment_service)
     FastAPIInstrumentor.instrument_app(app)
     yield
     # Shutdown
@@ -63,6 +77,9 @@ app = FastAPI(
     description="High-performance puzzle solving service with API versioning",
     version="1.0.0",
     lifespan=lifespan,
+    # No default_response_class override: ORJSONResponse is deprecated on
+    # current FastAPI, whose default response_model serialization is now
+    # faster than routing through ORJSONResponse
 )
 
 app.middleware("http")(observability_middleware)
@@ -1,19 +1,30 @@
+import itertools
+import secrets
 import time
-import uuid
 
+import structlog
 from fastapi import Request
+from opentelemetry import trace
 
-from puzzle_solver.api.versioning import get_api_version, validate_version
-from puzzle_solver.core.observability import correlation_id, request_counter, request_duration
+from puzzle_solver.api.versioning import resolve_version
+from puzzle_solver.core.observability import request_counter, request_duration
+
+# Probe endpoints hit many times per second; they skip all middleware work
+_FAST_PATHS = frozenset({"/health", "/metrics", "/ready"})
+
+# Random per-worker prefix + counter: unique IDs without per-request urandom
+_CID_PREFIX = secrets.token_hex(4)
+_CID_COUNTER = itertools.count()
 
 
 async def observability_middleware(request: Request, call_next):
     """Add observability and versioning to all requests."""
-    from opentelemetry import trace
+    if request.url.path in _FAST_PATHS:
+        return await call_next(request)
 
     # Set correlation ID
-    cid = request.headers.get("x-correlation-id") or str(uuid.uuid4())
-    correlation_id.set(cid)
+    cid = request.headers.get("x-correlation-id") or f"{_CID_PREFIX}-{next(_CID_COUNTER)}"
+    structlog.contextvars.bind_contextvars(correlation_id=cid)
 
     # Add correlation ID to current span
     current_span = trace.get_current_span()
@@ -21,23 +32,20 @@ async def observability_middleware(request: Request, call_next):
         current_span.set_attribute("correlation_id", cid)
         current_span.set_attribute("http.correlation_id", cid)
 
-    # API versioning
-    try:
-        api_version = get_api_version(request)
-        validate_version(api_version)
-    except Exception:  # noqa
-        api_version = "v1"  # Fallback to v1
+    # API versioning (also cached on request.state.api_version)
+    api_version = resolve_version(request)
 
-    # Metrics
-    start_time = time.time()
+    # Metrics: monotonic clock so durations are immune to wall-clock skew
+    method = request.method
+    path = request.url.path
+    start_ns = time.perf_counter_ns()
     response = await call_next(request)
-    duration = time.time() - start_time
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
 
-    request_counter.labels(method=request.method, endpoint=request.url.path).inc()
+    request_counter.labels(method=method, endpoint=path).inc()
     request_duration.observe(duration)
 
     response.headers["x-correlation-id"] = cid
     response.headers["api-version"] = api_version
-    response.headers["x-request-start-time"] = str(start_time)
     response.headers["x-request-duration"] = f"{duration:.6f}"
     return response
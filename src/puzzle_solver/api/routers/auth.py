@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -14,11 +16,24 @@ basic_auth = HTTPBasic()
 USERS = {"admin": "secret123"}
 
 
+def _hash_password(password: str) -> bytes:
+    return hashlib.blake2b(password.encode(), digest_size=16).digest()
+
+
+# Prehashed at import so login never touches the plaintext values
+_USERS_HASH = {username: _hash_password(password) for username, password in USERS.items()}
+_UNKNOWN_USER_HASH = b"\x00" * 16
+
+
 @router.post("/token", response_model=TokenResponse)
 async def login(credentials: HTTPBasicCredentials = Depends(basic_auth)):
     """Get JWT token with basic auth."""
     username = credentials.username
-    if username not in USERS or credentials.password != USERS[username]:
+    # Always hash and compare, even for unknown users, so response timing
+    # doesn't leak which usernames exist
+    provided = _hash_password(credentials.password)
+    expected = _USERS_HASH.get(username, _UNKNOWN_USER_HASH)
+    if not hmac.compare_digest(provided, expected) or username not in _USERS_HASH:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     access_token_expires = timedelta(hours=settings.ACCESS_TOKEN_EXPIRE_HOURS)
@@ -1,22 +1,25 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
+from puzzle_solver.api.dependencies import get_fragment_service
 from puzzle_solver.api.models import HealthResponse, ReadyResponse
 from puzzle_solver.domain.services.fragment import FragmentService
 
 router = APIRouter(tags=["health"])
 
+# The liveness body is constant: serialize it once instead of per probe
+_HEALTH_BODY = HealthResponse(status="ok").model_dump_json().encode()
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health():
     """Liveness probe - basic application health."""
-    return HealthResponse(status="ok")
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/ready", response_model=ReadyResponse)
-async def ready():
+async def ready(fragment_service: FragmentService = Depends(get_fragment_service)):
     """Readiness probe - external service connectivity."""
     try:
-        fragment_service = FragmentService()
         await fragment_service.test_connectivity()
         return ReadyResponse(status="ready")
     except Exception:
@@ -1,11 +1,29 @@
+import time
+
 from fastapi import APIRouter, Response
 
 from puzzle_solver.core.observability import CONTENT_TYPE_LATEST, get_metrics
 
 router = APIRouter(tags=["observability"])
 
+# Re-encoding the Prometheus registry is not free; burst scrapes within this
+# window share one rendered payload
+_METRICS_TTL_SECONDS = 1.0
+_metrics_cache: tuple[float, bytes] = (0.0, b"")
+
+
+def _render_metrics() -> bytes:
+    """Render Prometheus text, reusing the payload for up to 1 second."""
+    global _metrics_cache
+    now = time.monotonic()
+    rendered_at, payload = _metrics_cache
+    if not payload or now - rendered_at >= _METRICS_TTL_SECONDS:
+        payload = get_metrics()
+        _metrics_cache = (now, payload)
+    return payload
+
 
 @router.get("/metrics")
 async def metrics():
     """Prometheus metrics endpoint."""
-    return Response(content=get_metrics(), media_type=CONTENT_TYPE_LATEST)
+    return Response(content=_render_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 
 from puzzle_solver.api.auth import verify_token
+from puzzle_solver.api.dependencies import get_puzzle_service
 from puzzle_solver.api.models import PuzzleSolveResponse, PuzzleStats
 from puzzle_solver.domain.services.puzzle import PuzzleService
 
@@ -8,9 +9,8 @@ router = APIRouter(prefix="/puzzle", tags=["puzzle-v1"])
 
 
 @router.get("/solve", response_model=PuzzleSolveResponse)
-async def solve_puzzle(current_user: str = Depends(verify_token)):
+async def solve_puzzle(current_user: str = Depends(verify_token), service: PuzzleService = Depends(get_puzzle_service)):
     """Solve the puzzle and return results (v1) - requires JWT token."""
-    service = PuzzleService()
     result = await service.solve_puzzle()
 
     puzzle_stats = PuzzleStats(
@@ -1,21 +1,27 @@
+import re
+
 from fastapi import HTTPException, Request
 
+# Precompiled once: these run on every request via the middleware
+_PATH_VER = re.compile(r"^/(v\d+)(?:/|$)")
+_ACCEPT_VER = re.compile(r"version=(\d+)")
+
+_SUPPORTED_VERSIONS = frozenset({"v1"})
+
 
 def get_api_version(request: Request) -> str:
     """Extract an API version from URL path or headers."""
     # Check URL path first (/v1/, /v2/, etc.)
-    path_parts = request.url.path.strip("/").split("/")
-    if path_parts and path_parts[0].startswith("v") and path_parts[0][1:].isdigit():
-        return path_parts[0]
+    match = _PATH_VER.match(request.url.path)
+    if match:
+        return match.group(1)
 
     # Check Accept header (application/vnd.api+json;version=1)
-    accept_header = request.headers.get("accept", "")
-    if "version=" in accept_header:
-        try:
-            version_part = accept_header.split("version=")[1].split(";")[0].split(",")[0]
-            return f"v{version_part}"
-        except (IndexError, ValueError):
-            pass
+    accept_header = request.headers.get("accept")
+    if accept_header:
+        match = _ACCEPT_VER.search(accept_header)
+        if match:
+            return f"v{match.group(1)}"
 
     # Check custom API-Version header
     api_version = request.headers.get("api-version")
@@ -28,9 +34,18 @@ def get_api_version(request: Request) -> str:
 
 def validate_version(version: str) -> str:
     """Validate and normalize API version."""
-    supported_versions = ["v1"]
-    if version not in supported_versions:
+    if version not in _SUPPORTED_VERSIONS:
         raise HTTPException(
-            status_code=400, detail=f"Unsupported API version: {version}. Supported: {supported_versions}"
+            status_code=400, detail=f"Unsupported API version: {version}. Supported: {sorted(_SUPPORTED_VERSIONS)}"
         )
     return version
+
+
+def resolve_version(request: Request) -> str:
+    """Resolve and validate the request version once, caching it on request.state."""
+    try:
+        version = validate_version(get_api_version(request))
+    except Exception:  # noqa
+        version = "v1"  # Fallback to v1
+    request.state.api_version = version
+    return version
@@ -22,11 +22,11 @@ from puzzle_solver.domain.services.puzzle import PuzzleService
 async def main():  # Main CLI entry point for puzzle solving execution !!!
     import uuid
 
-    from puzzle_solver.core.observability import correlation_id
-
     setup_logging()
+    if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+: run tasks eagerly to skip a loop round-trip
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     # Set correlation ID for CLI operations
-    correlation_id.set(str(uuid.uuid4()))
+    structlog.contextvars.bind_contextvars(correlation_id=str(uuid.uuid4()))
 
     logger = structlog.get_logger()
     puzzle_service = PuzzleService()
@@ -36,42 +36,33 @@ async def main():  # Main CLI entry point for puzzle solving execution !!!
         _display_results(logger, result)
     except Exception as e:
         # guardrail: Handle puzzle solving failures gracefully
-        logger.error(f"Failed to solve puzzle: {e}")
+        logger.error("Failed to solve puzzle", error=str(e))
     finally:
         await close_http_session()
 
 
-def _display_results(logger, result) -> None:  # Display comprehensive puzzle solving results and statistics !!!
-    separator = "=" * 60
-
-    logger.info(separator)
-    logger.info(result.puzzle_text)
-    logger.info(separator)
-
-    _display_performance_stats(logger, result)
-    _display_completion_stats(logger, result)
-
-    logger.info(separator)
-    logger.info("Less than one second! :D" if result.elapsed_seconds < 1.0 else ":( took more than one second")
-
+# Rendered once instead of per display call
+_SEPARATOR = "=" * 60
 
-def _display_performance_stats(logger, result) -> None:  # Display timing and throughput performance metrics !!!
-    logger.info(f"Tiempo: {result.elapsed_seconds:.3f}s | Fragmentos: {result.stats.total_found}")
-    logger.info(f"Velocidad: {result.stats.fragments_per_second:.1f} fragments/s")
-    logger.info(f"Requests exitosos: {result.stats.total_requests}")
 
-
-def _display_completion_stats(logger, result) -> None:  # Display puzzle completion status and missing fragment info !!!
-    logger.info(f"Completitud: {result.stats.completion_rate:.1%} ({result.stats.completion_percentage:.1f}%)")
-    logger.info(f"Fragmentos faltantes: {result.stats.missing_count}")
-    logger.info(f"Status: {'Complete' if result.stats.is_complete else 'Incomplete'}")
-
-    if result.stats.missing_indices:
-        logger.info(f"Missing indices (first 10): {result.stats.missing_indices}")
+def _display_results(logger, result) -> None:  # Display comprehensive puzzle solving results and statistics !!!
+    # One record through the structlog pipeline instead of ~8: a single
+    # timestamp/context merge/render pass covers text, stats and verdict
+    logger.info(
+        f"{_SEPARATOR}\n{result.puzzle_text}\n{_SEPARATOR}",
+        elapsed_seconds=result.elapsed_seconds,
+        stats=result.stats.model_dump(),
+        fast=result.elapsed_seconds < 1.0,
+    )
 
 
 def cli_main():  # Synchronous entry point wrapper for asyncio execution !!!
-    asyncio.run(main())
+    try:
+        import uvloop  # noqa
+
+        uvloop.run(main())
+    except ImportError:
+        asyncio.run(main())  # uvloop is not essential, but preferred
 
 
 if __name__ == "__main__":
@@ -1,30 +1,26 @@
 import asyncio
+import logging
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Dict, Optional
+from typing import AsyncGenerator, Dict, Optional
 
 import aiohttp
-import orjson
 import structlog
 
-try:
-    import uvloop  # noqa
-
-    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-except ImportError:
-    pass  # uvloop is not essential, but preferred
-
 
 class HTTPClientManager:
     """Optimized HTTP session singleton."""
 
     _instance: Optional["HTTPClientManager"] = None
     _session: Optional[aiohttp.ClientSession] = None
-    _lock = asyncio.Lock()
+    # Created lazily inside a running loop: instantiating the lock at import
+    # time would bind it to whatever loop (if any) is current at import
+    _lock: Optional[asyncio.Lock] = None
 
     def __new__(cls) -> "HTTPClientManager":  # Singleton instance creation with logger initialization !!!
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.logger = structlog.get_logger()
+            cls._instance._debug_enabled = False
         return cls._instance
 
     async def get_session(
@@ -35,9 +31,15 @@ class HTTPClientManager:
             return self._session
 
         # Slow path: lock for creation
+        if HTTPClientManager._lock is None:
+            HTTPClientManager._lock = asyncio.Lock()
         async with self._lock:
             if self._session is None or self._session.closed:
-                self.logger.debug("Creating new HTTP session")
+                # Refresh here, after setup_logging has run, so hot-path debug
+                # calls reduce to one attribute test when DEBUG is filtered
+                self._debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+                if self._debug_enabled:
+                    self.logger.debug("Creating new HTTP session")
                 self._session = await self._create_session()
         return self._session
 
@@ -53,18 +55,20 @@ class HTTPClientManager:
             connector=connector,
             timeout=timeout,
             headers=headers,
-            json_serialize=lambda x: orjson.dumps(x).decode("utf-8"),
             raise_for_status=False,
         )
 
     @staticmethod
     def _create_connector() -> aiohttp.TCPConnector:  # Create optimized TCP connector with unlimited connections !!!
+        # aiohttp speaks HTTP/1.1 only; fragment fan-out relies on a warm
+        # keep-alive pool instead of HTTP/2 multiplexing, so the idle window
+        # stays above typical gaps between discovery rounds
         return aiohttp.TCPConnector(
             limit=0,  # No total limit
             limit_per_host=0,  # No limit per host
             ttl_dns_cache=600,  # DNS cache for 10 minutes
             use_dns_cache=True,
-            keepalive_timeout=60,  # Reuse connections
+            keepalive_timeout=75,  # Reuse connections across discovery rounds
             force_close=False,  # Aggressively reuse connections
         )
 
@@ -80,8 +84,14 @@ class HTTPClientManager:
         if self._session and not self._session.closed:
             try:
                 self.logger.debug("Closing HTTP session")
+                connector = self._session.connector
                 await self._session.close()
-                await asyncio.sleep(0.25)
+                if connector is not None:
+                    # Idempotent connector close instead of a blanket 250ms
+                    # sleep; one loop turn then lets transports finish their
+                    # shutdown callbacks
+                    await connector.close()
+                await asyncio.sleep(0)
             except Exception as e:
                 # guardrail: Handle session closing errors gracefully
                 self.logger.error("Error closing HTTP session", error=str(e))
@@ -107,32 +117,6 @@ class HTTPClientManager:
             self.logger.error("Unexpected request error", url=url, method=method, error=str(e))
             raise
 
-    async def fetch_json(
-        self, url: str, **kwargs
-    ) -> Optional[Dict[str, Any]]:  # Optimized JSON fetch helper with comprehensive error handling !!!
-        try:
-            async with self.request("GET", url, **kwargs) as resp:
-                if resp.status == 200:
-                    data = await resp.read()
-                    return orjson.loads(data)
-                elif resp.status >= 400:
-                    self.logger.warning("HTTP error response", url=url, status=resp.status)
-                else:
-                    self.logger.debug("Non-success HTTP status", url=url, status=resp.status)
-        except aiohttp.ClientConnectionError as e:
-            # guardrail: Handle connection failures gracefully
-            self.logger.error("Connection failed", url=url, error=str(e))
-        except asyncio.TimeoutError as e:
-            # guardrail: Handle request timeouts gracefully
-            self.logger.error("Request timed out", url=url, error=str(e))
-        except orjson.JSONDecodeError as e:
-            # guardrail: Handle JSON decode failures gracefully
-            self.logger.error("JSON decode failed", url=url, error=str(e))
-        except (ValueError, TypeError, RuntimeError) as e:
-            # guardrail: Handle unexpected errors in JSON fetching gracefully
-            self.logger.error("Unexpected error in fetch_json", url=url, error=str(e))
-        return None
-
 
 # Singleton instance
 http_manager = HTTPClientManager()
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
@@ -14,21 +16,21 @@ class FragmentServiceConfig(BaseModel):
         default=10, description="Batch size per range. Four parallel batches (initial_batch_size * 4)"
     )
 
-    @property
+    @cached_property
     def full_url(self) -> str:
-        """Full service URL."""
+        """Full service URL, computed once per config instance."""
         if self.base_url.startswith(("http://", "https://")):  # noqa
             return f"{self.base_url}{self.endpoint}"
         return f"https://{self.base_url}{self.endpoint}"
 
 
 class PuzzleServiceConfig(BaseModel):
-    """Puzzle service configuration."""
+    """Puzzle service configuration.
 
-    stream_threshold: int = Field(default=100, description="Fragment count to trigger puzzle text by streaming")
-    chunk_size: int = Field(
-        default=50, description="Streaming chunk size in case puzzle message bigger than stream_threshold"
-    )
+    Currently fieldless: the streaming-assembly knobs (stream_threshold,
+    chunk_size) died with the chunked join path. The model stays as the
+    config seam PuzzleService is constructed with.
+    """
 
 
 class LoggingConfig(BaseModel):
@@ -58,42 +60,19 @@ class Settings(BaseSettings):
     # OpenTelemetry configuration
     JAEGER_HOST: str = Field(default="localhost", description="Jaeger host")
 
-    # Backward compatibility properties
-    @property
-    def LOG_LEVEL(self) -> str:
-        return self.logging.level
-
-    @property
-    def LOG_FORMAT(self) -> str:
-        return self.logging.format
-
-    @property
-    def LOG_COLORIZE(self) -> bool:
-        return self.logging.colorize
-
-    @property
-    def LOG_TIMESTAMP_FORMAT(self) -> str:
-        return self.logging.timestamp_format
-
-    @property
-    def LOG_INCLUDE_STACK_INFO(self) -> bool:
-        return self.logging.include_stack_info
-
-    @property
-    def LOG_FILE_PATH(self) -> str | None:
-        return self.logging.file_path
-
-    @property
-    def LOG_CONTEXT_CLASS(self) -> str:
-        return self.logging.context_class
-
-    @property
-    def FRAGMENT_SERVICE(self) -> FragmentServiceConfig:
-        return self.fragment_service
-
-    @property
-    def PUZZLE_SERVICE(self) -> PuzzleServiceConfig:
-        return self.puzzle_service
+    def model_post_init(self, __context) -> None:
+        # Backward compatibility aliases: plain attributes instead of
+        # properties, so hot paths (log processors, per-request URL builds)
+        # skip the descriptor + nested-model traversal on every access
+        self.LOG_LEVEL = self.logging.level
+        self.LOG_FORMAT = self.logging.format
+        self.LOG_COLORIZE = self.logging.colorize
+        self.LOG_TIMESTAMP_FORMAT = self.logging.timestamp_format
+        self.LOG_INCLUDE_STACK_INFO = self.logging.include_stack_info
+        self.LOG_FILE_PATH = self.logging.file_path
+        self.LOG_CONTEXT_CLASS = self.logging.context_class
+        self.FRAGMENT_SERVICE = self.fragment_service
+        self.PUZZLE_SERVICE = self.puzzle_service
 
     class Config:
         env_file = ".env"
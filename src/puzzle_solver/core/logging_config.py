@@ -1,12 +1,14 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import List
+from typing import List, Optional
 
 import structlog
 from structlog.typing import Processor
 
 from puzzle_solver.config.settings import settings
-from puzzle_solver.core.observability import correlation_id
 
 
 def setup_logging():
@@ -33,17 +35,47 @@ def _configure_standard_logging(log_level: int) -> None:
         format="%(message)s",
         level=log_level,
         handlers=handlers,
+        # Without force, basicConfig is a no-op once the root logger has
+        # handlers, leaving a stale QueueHandler feeding a stopped listener
+        force=True,
     )
 
 
+# Background listener draining the log queue; kept at module scope so
+# repeated setup_logging calls reuse it instead of stacking listeners
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def _create_log_handlers() -> List[logging.Handler]:
-    """Create logging handlers based on configuration."""
-    handlers = [logging.StreamHandler(sys.stdout)]
+    """Create logging handlers based on configuration.
 
+    The stream/file handlers run on a background QueueListener thread, so
+    coroutines only pay for a lock-free queue put instead of a synchronous
+    write under the logging lock on the event loop thread.
+    """
+    global _queue_listener
+    _stop_queue_listener()
+
+    handlers: List[logging.Handler] = [logging.StreamHandler(sys.stdout)]
     if settings.LOG_FILE_PATH:
         handlers.append(logging.FileHandler(settings.LOG_FILE_PATH))
 
-    return handlers
+    log_queue: queue.Queue = queue.Queue(-1)
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+    return [logging.handlers.QueueHandler(log_queue)]
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background listener; safe to call repeatedly."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def _configure_structlog(log_level: int) -> None:
@@ -59,12 +91,24 @@ def _configure_structlog(log_level: int) -> None:
     )
 
 
+# Settings are fixed for the process lifetime, so the chain is built once
+# and reused by later setup_logging calls
+_processors: Optional[List[Processor]] = None
+
+
 def _create_processors() -> List[Processor]:
     """Create structlog processors based on configuration."""
+    global _processors
+    if _processors is not None:
+        return _processors
+
     processors: List[Processor] = [
+        # merge_contextvars pulls bound context (e.g. correlation_id) into
+        # the event dict via structlog's optimized merge instead of a
+        # per-record Python closure
+        structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.processors.TimeStamper(fmt=settings.LOG_TIMESTAMP_FORMAT),
-        _add_correlation_id,
     ]
 
     if settings.LOG_INCLUDE_STACK_INFO:
@@ -73,15 +117,10 @@ def _create_processors() -> List[Processor]:
     processors.append(structlog.processors.format_exc_info)
     processors.append(_create_renderer())
 
+    _processors = processors
     return processors
 
 
-def _add_correlation_id(logger, method_name, event_dict):
-    """Add correlation ID to log events."""
-    event_dict["correlation_id"] = correlation_id.get("")
-    return event_dict
-
-
 def _create_renderer() -> Processor:
     """Create appropriate log renderer based on format setting."""
     if settings.LOG_FORMAT.lower() == "json":
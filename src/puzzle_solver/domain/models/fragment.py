@@ -1,12 +1,25 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 
+from pydantic import BaseModel, Field, model_validator
 
-class Fragment(BaseModel):
-    """Single puzzle fragment."""
 
-    id: int = Field(..., description="Unique fragment identifier")
-    index: int = Field(..., description="Position in the puzzle sequence")
-    text: str = Field(..., description="Fragment content")
+@dataclass(slots=True, frozen=True)
+class Fragment:
+    """Single puzzle fragment.
+
+    A plain slotted dataclass rather than a Pydantic model: fragments are
+    constructed once per HTTP response by the thousands, and skipping
+    per-field validation machinery keeps that hot path cheap.
+
+    text stays a str on purpose: orjson already yields decoded strings when
+    parsing the response body, so a bytes field would add an encode per
+    fragment rather than remove a decode, and the API layer serializes
+    batches straight back to JSON text.
+    """
+
+    id: int  # Unique fragment identifier
+    index: int  # Position in the puzzle sequence
+    text: str  # Fragment content
 
     def __str__(self) -> str:  # String representation with truncated text for readability !!!
         return (
@@ -22,14 +35,14 @@ class FragmentBatch(BaseModel):
     fragments: list[Fragment] = Field(default_factory=list)
     total_found: int = Field(0, description="Number of fragments found")
     missing_indices: list[int] = Field(default_factory=list, description="Indices of missing fragments")
-
-    @property
-    def is_complete(self) -> bool:  # Check if all fragments are present with no missing indices !!!
-        return len(self.missing_indices) == 0
-
-    @property
-    def completion_percentage(
-        self,
-    ) -> float:  # Calculate completion percentage based on found vs expected fragments !!!
+    is_complete: bool = Field(False, description="All fragments present with no missing indices")
+    completion_percentage: float = Field(0.0, description="Completion percentage of found vs expected fragments")
+
+    @model_validator(mode="after")
+    def _compute_completion(self) -> "FragmentBatch":
+        # Computed once at construction: stats emission reads these several
+        # times and plain attributes skip the property descriptor each access
+        self.is_complete = len(self.missing_indices) == 0
         total_expected = self.total_found + len(self.missing_indices)
-        return (self.total_found / total_expected * 100) if total_expected > 0 else 0.0
+        self.completion_percentage = (self.total_found / total_expected * 100) if total_expected > 0 else 0.0
+        return self
@@ -1,14 +1,95 @@
 import asyncio
+import logging
+import random
 from abc import ABC, abstractmethod
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
 
+import orjson
 import structlog
-from pydantic import BaseModel
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from puzzle_solver.clients.http_client import http_manager
+from puzzle_solver.core.observability import FRAGMENT_ERROR, FRAGMENT_OK
 
-T = TypeVar("T", bound=BaseModel)
+T = TypeVar("T")
+
+# Statuses that signal server congestion rather than a bad request
+_THROTTLE_STATUSES = frozenset({429, 503})
+
+# Backoff policy when the server gives no Retry-After hint
+_BACKOFF_BASE = 0.1
+_BACKOFF_CAP = 30.0
+
+# Bodies above this size are decoded on the default executor; orjson releases
+# the GIL, so the parse overlaps with event-loop I/O instead of stalling it
+_INLINE_PARSE_LIMIT = 16_384
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Sleep time before the next attempt.
+
+    Honors Retry-After (delta-seconds or HTTP-date) when the server sent
+    one; otherwise jittered exponential backoff capped at 30s.
+    """
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(UTC)).total_seconds())
+            except (TypeError, ValueError):
+                pass  # fall through to backoff on an unparseable header
+    return min(random.uniform(0.5, 1.5) * _BACKOFF_BASE * (2**attempt), _BACKOFF_CAP)
+
+
+class AdaptiveThrottle:
+    """Concurrency limiter that adapts to server congestion signals.
+
+    Permits halve (down to 1) whenever the server answers 429/503 and grow
+    back one at a time after a run of successes, so retry storms back off
+    instead of amplifying the congestion that caused them.
+    """
+
+    def __init__(self, max_permits: int, growth_threshold: int = 20) -> None:
+        self.max_permits = max_permits
+        self.permits = max_permits
+        self._growth_threshold = growth_threshold
+        self._successes = 0
+        self._active = 0
+        # Created lazily inside the running loop, like the HTTP session lock
+        self._condition: Optional[asyncio.Condition] = None
+
+    def _cond(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def __aenter__(self) -> "AdaptiveThrottle":
+        condition = self._cond()
+        async with condition:
+            while self._active >= self.permits:
+                await condition.wait()
+            self._active += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        condition = self._cond()
+        async with condition:
+            self._active -= 1
+            condition.notify()
+
+    def record_success(self) -> None:
+        """Grow permits by one after a sustained run of successes."""
+        self._successes += 1
+        if self._successes >= self._growth_threshold and self.permits < self.max_permits:
+            self._successes = 0
+            self.permits += 1
+
+    def record_throttled(self) -> None:
+        """Halve permits (min 1) on a congestion response."""
+        self._successes = 0
+        self.permits = max(1, self.permits // 2)
 
 
 class BaseWebService(ABC, Generic[T]):
@@ -21,60 +102,116 @@ class BaseWebService(ABC, Generic[T]):
         self.max_concurrent = max_concurrent
         self.timeout = timeout
         self.max_retries = max_retries
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.throttle = AdaptiveThrottle(max_concurrent)
         self.logger = structlog.get_logger()
+        # Evaluated once: hot-path debug calls cost a single attribute test
+        # instead of a filtered logger call with kwargs dict per fragment
+        self._debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
         self.successful_requests = 0
 
     @abstractmethod
     def parse_response(self, data: Dict[str, Any]) -> Optional[T]:  # Parse JSON response to model abstract method !!!
         pass
 
+    def decode_response(
+        self, data: bytes
+    ) -> Optional[T]:  # Decode raw response bytes; subclasses may plug in reusable typed decoders !!!
+        try:
+            json_data = orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            # guardrail: Handle malformed response bodies gracefully
+            self.logger.warning("JSON decode failed", error=str(e))
+            return None
+        return self.parse_response(json_data) if json_data else None
+
     @abstractmethod
     def build_url(self, **params: Any) -> str:  # Build service URL abstract method !!!
         pass
 
     async def fetch_single(
         self, **params: Any
-    ) -> Optional[T]:  # Fetch single item with semaphore concurrency control !!!
-        async with self.semaphore:
+    ) -> Optional[T]:  # Fetch single item with adaptive concurrency control !!!
+        async with self.throttle:
             return await self._fetch_with_retry(**params)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.1, min=0.1, max=2.0),
-        retry=retry_if_exception_type((asyncio.TimeoutError, ConnectionError)),
-    )
     async def _fetch_with_retry(
         self, **params: Any
-    ) -> Optional[T]:  # Fetch with tenacity retry logic for network resilience !!!
+    ) -> Optional[T]:  # Fetch with inline retry loop for network resilience !!!
+        # Plain loop instead of a tenacity decorator: no Retrying object,
+        # statistics tracker or exception matcher allocated per call
         url = self.build_url(**params)
-        self.logger.debug("Fetching URL", url=url)
+        if self._debug_enabled:
+            self.logger.debug("Fetching URL", url=url)
 
-        try:
-            json_data = await http_manager.fetch_json(url)
-            if json_data:
-                self.successful_requests += 1
-                self.logger.debug("Fetch successful", url=url)
-                return self.parse_response(json_data)
-            self.logger.debug("No data received", url=url)
-            return None
-        except (asyncio.TimeoutError, ConnectionError) as e:
-            # guardrail: Handle retryable network errors gracefully
-            self.logger.warning("Retryable error fetching", url=url, error=str(e))
-            raise
-        except Exception as e:
-            # guardrail: Handle non-retryable errors without crashing
-            self.logger.error("Non-retryable error fetching", url=url, error=str(e))
-            return None
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with http_manager.request("GET", url) as resp:
+                    status = resp.status
+                    if status in _THROTTLE_STATUSES:
+                        # Congestion signal: shed concurrency before retrying
+                        self.throttle.record_throttled()
+                        self.logger.warning("Server throttling", url=url, status=status, attempt=attempt)
+                        if attempt == self.max_retries:
+                            return None
+                        await asyncio.sleep(_retry_delay(resp.headers.get("Retry-After"), attempt))
+                        continue
+                    if status != 200:
+                        if status >= 400:
+                            self.logger.warning("HTTP error response", url=url, status=status)
+                        elif self._debug_enabled:
+                            self.logger.debug("Non-success HTTP status", url=url, status=status)
+                        return None
+                    data = await resp.read()
+                if data:
+                    self.successful_requests += 1
+                    self.throttle.record_success()
+                    if self._debug_enabled:
+                        self.logger.debug("Fetch successful", url=url)
+                    if len(data) > _INLINE_PARSE_LIMIT:
+                        return await asyncio.get_running_loop().run_in_executor(None, self.decode_response, data)
+                    return self.decode_response(data)
+                if self._debug_enabled:
+                    self.logger.debug("No data received", url=url)
+                return None
+            except (asyncio.TimeoutError, ConnectionError) as e:
+                # guardrail: Handle retryable network errors gracefully
+                self.logger.warning("Retryable error fetching", url=url, attempt=attempt, error=str(e))
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(_retry_delay(None, attempt))
+            except Exception as e:
+                # guardrail: Handle non-retryable errors without crashing
+                self.logger.error("Non-retryable error fetching", url=url, error=str(e))
+                return None
+        return None
 
     async def fetch_batch(
         self, param_list: List[Dict[str, Any]]
     ) -> List[T]:  # Fetch multiple items in parallel with error handling !!!
-        self.logger.debug("Starting batch fetch", batch_size=len(param_list))
-        tasks = [self.fetch_single(**params) for params in param_list]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if self._debug_enabled:
+            self.logger.debug("Starting batch fetch", batch_size=len(param_list))
+        # Pre-sized slot list filled in place: no gather wrapper future per
+        # task and no second results list held until the slowest completes
+        results: List[Optional[T]] = [None] * len(param_list)
+
+        async def _fetch_into(slot: int, params: Dict[str, Any]) -> None:
+            try:
+                results[slot] = await self.fetch_single(**params)
+            except Exception as e:
+                # guardrail: One failed fetch must not cancel its siblings
+                if self._debug_enabled:
+                    self.logger.debug("Batch fetch exception", error=str(e))
+
+        async with asyncio.TaskGroup() as tg:
+            for slot, params in enumerate(param_list):
+                tg.create_task(_fetch_into(slot, params))
+
         filtered_results = self._filter_valid_results(results)
-        self.logger.debug("Batch fetch completed", requested=len(param_list), successful=len(filtered_results))
+        # One locked increment per batch instead of one per item
+        FRAGMENT_OK.inc(len(filtered_results))
+        FRAGMENT_ERROR.inc(len(param_list) - len(filtered_results))
+        if self._debug_enabled:
+            self.logger.debug("Batch fetch completed", requested=len(param_list), successful=len(filtered_results))
         return filtered_results
 
     async def fetch_range(
@@ -84,12 +221,11 @@ class BaseWebService(ABC, Generic[T]):
         return await self.fetch_batch(param_list)
 
     def _filter_valid_results(
-        self, results: List[Any]
-    ) -> List[T]:  # Filter valid results from batch fetch excluding exceptions !!!
-        valid_results: List[T] = []
-        for result in results:
-            if isinstance(result, BaseModel) and result is not None:
-                valid_results.append(result)
-            elif isinstance(result, Exception):
-                self.logger.debug(f"Batch fetch exception: {result}")
-        return valid_results
+        self, results: List[Optional[T]]
+    ) -> List[T]:  # Filter valid results from batch fetch excluding failed slots !!!
+        # Single comprehension over the pre-sized slot list; missing-index
+        # math lives in find_fragment_bounds, which scans its slots in one
+        # pass as well. Batches here are tens of items, far below the size
+        # where handing the presence mask to a vectorized scan would pay for
+        # the array conversions.
+        return [result for result in results if result is not None]
@@ -0,0 +1,77 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from puzzle_solver.domain.models.fragment import Fragment
+
+
+class FragmentBatcher:
+    """Coalesces concurrent fragment requests into shared batch dispatches.
+
+    Callers submit the fragment ids they need; submissions arriving within
+    the queue window (or until the batch fills) are merged, deduplicated and
+    dispatched as one batch, so concurrent puzzle solves share HTTP work on
+    overlapping indices instead of fetching them independently. The dispatch
+    callable returns a mapping keyed by requested id, so every caller gets
+    back exactly the entries for the ids it submitted.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[List[int]], Awaitable[Dict[int, Fragment]]],
+        max_batch_size: int = 40,
+        max_queue_time: float = 0.005,
+    ) -> None:
+        self._dispatch = dispatch
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._queued: set[int] = set()
+        self._waiters: List[Tuple[frozenset, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Strong refs to in-flight dispatches: the loop only keeps weak
+        # references to tasks, so an unreferenced batch could be collected
+        # mid-dispatch and strand its waiters
+        self._dispatch_tasks: set[asyncio.Task] = set()
+
+    async def submit(self, fragment_ids: List[int]) -> List[Fragment]:  # Request ids through the shared batch !!!
+        if not fragment_ids:
+            return []
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        ids = frozenset(fragment_ids)
+        self._waiters.append((ids, future))
+        self._queued |= ids
+
+        if len(self._queued) >= self.max_batch_size:
+            self._flush_now()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_queue_time, self._flush_now)
+
+        fragments_by_id = await future
+        # Exactly this caller's share of the batch: only ids it submitted,
+        # in the order it submitted them
+        return [fragments_by_id[fid] for fid in fragment_ids if fid in fragments_by_id]
+
+    def _flush_now(self) -> None:  # Dispatch everything queued as one batch !!!
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._waiters:
+            return
+        waiters, self._waiters = self._waiters, []
+        queued, self._queued = self._queued, set()
+        task = asyncio.ensure_future(self._run_batch(sorted(queued), waiters))
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _run_batch(self, fragment_ids: List[int], waiters: List[Tuple[frozenset, asyncio.Future]]) -> None:
+        try:
+            fragments_by_id = await self._dispatch(fragment_ids)
+        except Exception as e:
+            # guardrail: Propagate dispatch failures to every waiter
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for _, future in waiters:
+            if not future.done():
+                future.set_result(fragments_by_id)
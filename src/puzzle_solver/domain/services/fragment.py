@@ -1,14 +1,21 @@
 import asyncio
+import math
 from typing import Any
 
 import structlog
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from puzzle_solver.config.settings import FragmentServiceConfig
-from puzzle_solver.core.observability import fragment_counter, tracer
+from puzzle_solver.core.observability import FRAGMENT_FOUND, FRAGMENT_MISSING, tracer
 from puzzle_solver.domain.models.fragment import Fragment, FragmentBatch
 from puzzle_solver.domain.services.base import BaseWebService
-from puzzle_solver.utils.fragment_utils import build_validated_url, find_fragment_bounds
+from puzzle_solver.domain.services.batcher import FragmentBatcher
+from puzzle_solver.utils.fragment_utils import _build_url_fast, find_fragment_bounds
+
+# Built once at import and reused everywhere: validate_json goes
+# bytes -> Fragment in a single pydantic-core pass without an intermediate
+# dict or per-call validator construction
+_FRAGMENT_ADAPTER: TypeAdapter = TypeAdapter(Fragment)
 
 
 class FragmentService(BaseWebService[Fragment]):
@@ -25,6 +32,12 @@ class FragmentService(BaseWebService[Fragment]):
             timeout=self.config.timeout,
             max_retries=self.config.max_retries,
         )
+        # Single-fragment lookups and gap refetches from concurrent solves
+        # coalesce into shared batches
+        self.batcher = FragmentBatcher(self._dispatch_fragment_ids, max_batch_size=self.config.max_concurrent)
+        # Invalid payloads are counted here and reported once per discovery
+        # instead of rendering a structlog warning per bad fragment
+        self._invalid_count = 0
         self.logger.info(
             "FragmentService initialized", base_url=self.config.base_url, max_concurrent=self.config.max_concurrent
         )
@@ -33,22 +46,54 @@ class FragmentService(BaseWebService[Fragment]):
         self, data: dict[str, Any]
     ) -> Fragment | None:  # Parse JSON response data to Fragment model with validation !!!
         try:
-            return Fragment(**data)
+            # Same typed validation as the bytes path: bare Fragment(**data)
+            # would accept wrong-typed field values without complaint
+            return _FRAGMENT_ADAPTER.validate_python(data)
         except ValidationError as e:
             # guardrail: Handle invalid fragment data gracefully
-            self.logger.warning("Invalid fragment data", error=str(e))
+            self._invalid_count += 1
+            if self._debug_enabled:
+                self.logger.debug("Invalid fragment data", error=str(e))
             return None
 
-    def build_url(self, fragment_id: int) -> str:  # Build validated fragment URL with ID parameter !!!
-        return build_validated_url(self.base_url, fragment_id)
+    def decode_response(
+        self, data: bytes
+    ) -> Fragment | None:  # Decode raw bytes straight to Fragment with the shared typed decoder !!!
+        try:
+            return _FRAGMENT_ADAPTER.validate_json(data)
+        except ValidationError as e:
+            # guardrail: Handle invalid fragment payloads gracefully
+            self._invalid_count += 1
+            if self._debug_enabled:
+                self.logger.debug("Invalid fragment data", error=str(e))
+            return None
+
+    def build_url(self, fragment_id: int) -> str:  # Build fragment URL with ID parameter !!!
+        # Ids here come from typed config/int params lists, so skip the
+        # per-call isinstance/range check on the hot path
+        return _build_url_fast(self.base_url, fragment_id)
 
     async def test_connectivity(self) -> None:  # Test connectivity to fragment service by fetching single fragment !!!
         await self.fetch_single(fragment_id=1)
 
     async def get_fragment(
         self, fragment_id: int
-    ) -> Fragment | None:  # Get single fragment by ID with error handling !!!
-        return await self.fetch_single(fragment_id=fragment_id)
+    ) -> Fragment | None:  # Get single fragment by ID through the shared batcher !!!
+        fragments = await self.batcher.submit([fragment_id])
+        return fragments[0] if fragments else None
+
+    async def _dispatch_fragment_ids(
+        self, fragment_ids: list[int]
+    ) -> dict[int, Fragment]:  # Dispatch one coalesced batch keyed by requested ID !!!
+        fragments = await self.fetch_batch([{"fragment_id": fid} for fid in fragment_ids])
+        if len(fragments) == len(fragment_ids):
+            # fetch_batch preserves request order, so a fully successful
+            # batch aligns 1:1 with the ids that produced it
+            return dict(zip(fragment_ids, fragments))
+        # Failed slots are filtered out of a partial batch, losing positional
+        # alignment; key strictly by the id the server reported so a missing
+        # id stays missing instead of borrowing a neighbour's fragment
+        return {f.id: f for f in fragments}
 
     async def get_fragments_batch(
         self, fragment_ids: list[int]
@@ -64,41 +109,102 @@ class FragmentService(BaseWebService[Fragment]):
 
     async def _fetch_missing_fragments(
         self, missing_indices: list[int]
-    ) -> list[Fragment]:  # Fetch fragments for missing indices to complete puzzle !!!
-        param_list = [{"fragment_id": idx} for idx in missing_indices]
-        return await self.fetch_batch(param_list)
+    ) -> list[Fragment]:  # Fetch fragments for missing indices through the shared batcher !!!
+        return await self.batcher.submit(missing_indices)
 
     async def discover_fragments(
         self, initial_batch_size: int | None = None
     ) -> FragmentBatch:  # Discover all puzzle fragments with maximum parallelism and gap detection !!!
         with tracer.start_as_current_span("discover_fragments") as span:
             batch_size = initial_batch_size or self.config.initial_batch_size
-            span.set_attribute("batch_size", batch_size)
             self.logger.info("Starting fragment discovery", batch_size=batch_size)
 
             ranges = self._generate_discovery_ranges(batch_size)
-            self.logger.debug("Generated discovery ranges", ranges=ranges)
-
-            tasks = [self.get_fragment_range(start, end - start + 1) for start, end in ranges]
-            range_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            all_fragments = self._collect_valid_fragments(range_results)
-            batch = self._create_fragment_batch(all_fragments)
-
-            # Search for missing fragments until complete
-            while batch.missing_indices:
-                self.logger.info("Searching for missing fragments", missing_count=len(batch.missing_indices))
-                missing_fragments = await self._fetch_missing_fragments(batch.missing_indices)
-                all_fragments.extend(missing_fragments)
-                batch = self._create_fragment_batch(all_fragments)
+            if self._debug_enabled:
+                self.logger.debug("Generated discovery ranges", ranges=ranges)
+
+            range_tasks = [
+                asyncio.ensure_future(self.get_fragment_range(start, end - start + 1)) for start, end in ranges
+            ]
+
+            # Incremental bookkeeping: dedupe map plus missing set, updated in
+            # place each round instead of re-running the full bounds scan over
+            # an ever-growing fragment list
+            index_map: dict[int, Fragment] = {}
+            in_flight: set[int] = set()
+            gap_tasks: list[asyncio.Task] = []
+
+            # Fold ranges as they land and start filling their internal gaps
+            # immediately, while slower ranges are still in flight
+            for future in asyncio.as_completed(range_tasks):
+                try:
+                    fragments = await future
+                except Exception as e:
+                    # guardrail: A failed range must not abort discovery
+                    self.logger.warning("Discovery range failed", error=str(e))
+                    continue
+                for fragment in fragments:
+                    index_map.setdefault(fragment.index, fragment)
+                local_indices = {f.index for f in fragments}
+                if local_indices:
+                    local_gaps = set(range(min(local_indices), max(local_indices) + 1))
+                    local_gaps.difference_update(index_map.keys(), in_flight)
+                    if local_gaps:
+                        in_flight |= local_gaps
+                        gap_tasks.append(asyncio.ensure_future(self._fetch_missing_fragments(sorted(local_gaps))))
+
+            for gap_fragments in await asyncio.gather(*gap_tasks):
+                for fragment in gap_fragments:
+                    index_map.setdefault(fragment.index, fragment)
+
+            max_idx = max(index_map) if index_map else 0
+            min_idx = min(index_map) if index_map else 0
+            missing = set(range(min_idx, max_idx + 1)) - index_map.keys()
+
+            # Search for missing fragments until complete or stalled
+            while missing:
+                self.logger.info("Searching for missing fragments", missing_count=len(missing))
+                missing_fragments = await self._fetch_missing_fragments(sorted(missing))
+                recovered = missing.intersection(f.index for f in missing_fragments)
+                if not recovered:
+                    # guardrail: A permanently absent index (e.g. server 404)
+                    # must not spin the loop forever; report it and move on
+                    self.logger.warning("Unrecoverable missing fragments", missing_indices=sorted(missing))
+                    break
+                for fragment in missing_fragments:
+                    if fragment.index not in index_map:
+                        index_map[fragment.index] = fragment
+                        if fragment.index > max_idx:
+                            # The fetch revealed a wider sequence; the gap up
+                            # to the new extreme becomes missing
+                            missing.update(range(max_idx + 1, fragment.index))
+                            max_idx = fragment.index
+                missing.difference_update(recovered)
+
+            batch = FragmentBatch(
+                fragments=[index_map[i] for i in sorted(index_map)],
+                total_found=len(index_map),
+                missing_indices=sorted(missing),
+            )
 
             # Update metrics
-            fragment_counter.labels(status="found").inc(batch.total_found)
-            fragment_counter.labels(status="missing").inc(len(batch.missing_indices))
-
-            span.set_attribute("fragments_found", batch.total_found)
-            span.set_attribute("fragments_missing", len(batch.missing_indices))
-
+            FRAGMENT_FOUND.inc(batch.total_found)
+            FRAGMENT_MISSING.inc(len(batch.missing_indices))
+
+            # One attribute-dict merge, and only when a sampler is actually
+            # recording this span (no-op tracers skip the work entirely)
+            if span.is_recording():
+                span.set_attributes(
+                    {
+                        "batch_size": batch_size,
+                        "fragments_found": batch.total_found,
+                        "fragments_missing": len(batch.missing_indices),
+                    }
+                )
+
+            invalid_count, self._invalid_count = self._invalid_count, 0
+            if invalid_count:
+                self.logger.warning("Invalid fragment payloads during discovery", count=invalid_count)
             self.logger.info(
                 "Fragment discovery completed",
                 total_found=batch.total_found,
@@ -107,16 +213,17 @@ class FragmentService(BaseWebService[Fragment]):
             )
             return batch
 
-    @staticmethod
     def _generate_discovery_ranges(
-        batch_size: int,
-    ) -> list[tuple[int, int]]:  # Generate discovery ranges for parallel fragment fetching optimization !!!
-        return [
-            (1, batch_size),
-            (batch_size + 1, batch_size * 2),
-            (batch_size * 2 + 1, batch_size * 3),
-            (batch_size * 3 + 1, batch_size * 4),
-        ]
+        self, batch_size: int
+    ) -> list[tuple[int, int]]:  # Generate discovery ranges sized to saturate the concurrency budget !!!
+        # Enough batch_size-wide ranges to cover max_concurrent ids up front,
+        # so initial discovery saturates the throttle instead of capping at a
+        # fixed 4 ranges regardless of quota. Floored at the historical 4 so
+        # a large batch_size can only widen the sweep, never narrow it — the
+        # missing-loop only fills gaps below the highest index seen, so an
+        # unprobed tail would be misreported as complete
+        num_ranges = max(4, math.ceil(self.max_concurrent / batch_size))
+        return [(i * batch_size + 1, (i + 1) * batch_size) for i in range(num_ranges)]
 
     @staticmethod
     def _collect_valid_fragments(
@@ -1,26 +1,42 @@
+"""Leaf helpers for fragment URL building and sequence bookkeeping.
+
+Kept compilable-by-anything simple: no async, no dynamic attributes, and
+the hot loops already delegate to C (set difference, sorted, str.join), so
+an optional ahead-of-time compile of this module stays a drop-in if the
+build ever grows a binary wheel.
+"""
+
 from puzzle_solver.domain.models.fragment import Fragment
 
 
+def _build_url_fast(
+    base_url: str, fragment_id: int
+) -> str:  # Build fragment URL without validation for trusted internal callers !!!
+    return f"{base_url}?id={fragment_id}"
+
+
 def build_validated_url(
     base_url: str, fragment_id: int
 ) -> str:  # Build fragment URL with validation for non-negative integers !!!
     if not isinstance(fragment_id, int) or fragment_id < 0:
         raise ValueError("fragment_id must be a non-negative integer")
-    return f"{base_url}?id={fragment_id}"
+    return _build_url_fast(base_url, fragment_id)
 
 
 def find_fragment_bounds(
     fragments: list[Fragment],
 ) -> tuple[list[Fragment], list[int]]:  # Remove duplicates and find missing indices in fragment sequence !!!
     fragments_by_index = {f.index: f for f in fragments}
-    unique_fragments = list(fragments_by_index.values())
-    indices = list(fragments_by_index.keys())
 
-    if not indices:
-        return unique_fragments, []
+    if not fragments_by_index:
+        return [], []
 
-    min_idx, max_idx = min(indices), max(indices)
-    missing_indices = [i for i in range(min_idx, max_idx + 1) if i not in fragments_by_index]
+    # Set difference runs the gap scan in C instead of a Python loop over
+    # the span, and the dict's keys view participates without a copy
+    min_idx = min(fragments_by_index)
+    max_idx = max(fragments_by_index)
+    missing_indices = sorted(set(range(min_idx, max_idx + 1)).difference(fragments_by_index))
+    unique_fragments = [fragments_by_index[idx] for idx in sorted(fragments_by_index)]
 
     return unique_fragments, missing_indices
 
@@ -31,8 +47,14 @@ def estimate_id_for_index(
     if len(sample_fragments) < 2:
         return target_index
 
-    sample_fragments.sort(key=lambda f: f.index)
-    first, last = sample_fragments[0], sample_fragments[-1]
+    # Only the extreme-index samples matter: one pass with two accumulators
+    # replaces the full sort (and stops mutating the caller's list)
+    first = last = sample_fragments[0]
+    for fragment in sample_fragments[1:]:
+        if fragment.index < first.index:
+            first = fragment
+        elif fragment.index > last.index:
+            last = fragment
 
     if last.index == first.index:
         return first.id
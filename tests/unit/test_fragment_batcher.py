@@ -0,0 +1,105 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from puzzle_solver.config.settings import FragmentServiceConfig
+from puzzle_solver.domain.models.fragment import Fragment
+from puzzle_solver.domain.services.batcher import FragmentBatcher
+from puzzle_solver.domain.services.fragment import FragmentService
+
+
+class RecordingDispatch:
+    """Dispatch stub that records every batch and answers from a fixed map."""
+
+    def __init__(self, fragments_by_id=None, exc=None):
+        self.calls = []
+        self._fragments_by_id = fragments_by_id or {}
+        self._exc = exc
+
+    async def __call__(self, fragment_ids):
+        self.calls.append(list(fragment_ids))
+        if self._exc is not None:
+            raise self._exc
+        return {fid: self._fragments_by_id[fid] for fid in fragment_ids if fid in self._fragments_by_id}
+
+
+@pytest.fixture
+def fragment_config():
+    return FragmentServiceConfig(base_url="https://test.com", endpoint="/fragment")
+
+
+class TestFragmentBatcher:
+    @pytest.mark.asyncio
+    async def test_concurrent_submits_coalesce_into_one_batch(self):
+        fragments = {i: Fragment(id=i, index=i, text=f"t{i}") for i in (1, 2, 3)}
+        dispatch = RecordingDispatch(fragments)
+        batcher = FragmentBatcher(dispatch, max_batch_size=40, max_queue_time=0.001)
+
+        first, second = await asyncio.gather(batcher.submit([1, 2]), batcher.submit([2, 3]))
+
+        assert dispatch.calls == [[1, 2, 3]]  # merged and deduplicated
+        assert [f.id for f in first] == [1, 2]
+        assert [f.id for f in second] == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting_for_timer(self):
+        fragments = {1: Fragment(id=1, index=1, text="a"), 2: Fragment(id=2, index=2, text="b")}
+        dispatch = RecordingDispatch(fragments)
+        # Queue window far too long to matter: only the size limit can flush
+        batcher = FragmentBatcher(dispatch, max_batch_size=2, max_queue_time=60.0)
+
+        result = await asyncio.wait_for(batcher.submit([1, 2]), timeout=1.0)
+
+        assert [f.id for f in result] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_failed_id_not_borrowed_on_index_collision(self):
+        # id 3 fails server-side while id 4's fragment happens to carry
+        # index 3; the waiter for 3 must get nothing, not 4's fragment
+        dispatch = RecordingDispatch({4: Fragment(id=4, index=3, text="x")})
+        batcher = FragmentBatcher(dispatch, max_batch_size=40, max_queue_time=0.001)
+
+        missing, found = await asyncio.gather(batcher.submit([3]), batcher.submit([4]))
+
+        assert missing == []
+        assert [f.id for f in found] == [4]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_failure_reaches_all_waiters(self):
+        dispatch = RecordingDispatch(exc=RuntimeError("dispatch failed"))
+        batcher = FragmentBatcher(dispatch, max_batch_size=40, max_queue_time=0.001)
+
+        results = await asyncio.gather(batcher.submit([1]), batcher.submit([2]), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_empty_submit_short_circuits(self):
+        dispatch = RecordingDispatch()
+        batcher = FragmentBatcher(dispatch, max_batch_size=40, max_queue_time=0.001)
+
+        assert await batcher.submit([]) == []
+        assert dispatch.calls == []
+
+
+class TestDispatchFragmentIds:
+    @pytest.mark.asyncio
+    async def test_full_batch_aligns_positionally(self, fragment_config):
+        service = FragmentService(fragment_config)
+        fragments = [Fragment(id=10, index=0, text="a"), Fragment(id=11, index=1, text="b")]
+        service.fetch_batch = AsyncMock(return_value=fragments)
+
+        mapping = await service._dispatch_fragment_ids([7, 9])
+
+        assert mapping == {7: fragments[0], 9: fragments[1]}
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_keys_by_reported_id(self, fragment_config):
+        service = FragmentService(fragment_config)
+        fragment = Fragment(id=4, index=3, text="x")
+        service.fetch_batch = AsyncMock(return_value=[fragment])
+
+        mapping = await service._dispatch_fragment_ids([3, 4])
+
+        assert mapping == {4: fragment}  # id 3 stays missing
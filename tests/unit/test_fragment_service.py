@@ -94,7 +94,7 @@ class TestFragmentService:
         assert batch.total_found == 3
         assert len(batch.missing_indices) == 0
         assert batch.is_complete is True
-        assert service.fetch_batch.call_count == 4  # 4 ranges
+        assert service.fetch_batch.call_count == 8  # max_concurrent 40 / batch_size 5 ranges
 
     @pytest.mark.asyncio
     async def test_discover_fragments_with_missing(self, fragment_config, sample_fragments):
@@ -103,13 +103,8 @@ class TestFragmentService:
         # Second call returns the missing fragment
         missing_fragment = Fragment(id=4, index=2, text="missing")
         service.fetch_batch = AsyncMock(
-            side_effect=[
-                sample_fragments,  # Initial discovery
-                sample_fragments,  # Range 2
-                sample_fragments,  # Range 3
-                sample_fragments,  # Range 4
-                [missing_fragment],  # Missing fragment fetch
-            ]
+            side_effect=[sample_fragments] * 8  # 8 discovery ranges
+            + [[missing_fragment]]  # Missing fragment fetch
         )
 
         batch = await service.discover_fragments()
@@ -117,7 +112,7 @@ class TestFragmentService:
         assert batch.total_found == 4  # 3 original + 1 missing
         assert len(batch.missing_indices) == 0
         assert batch.is_complete is True
-        assert service.fetch_batch.call_count == 5  # 4 ranges + 1 missing fetch
+        assert service.fetch_batch.call_count == 9  # 8 ranges + 1 missing fetch
 
     def test_generate_discovery_ranges(self, fragment_config):
         service = FragmentService(fragment_config)
@@ -1,88 +1,115 @@
-from unittest.mock import AsyncMock
-
 import pytest
 
 from puzzle_solver.config.settings import PuzzleServiceConfig
 from puzzle_solver.domain.models.fragment import Fragment, FragmentBatch
 from puzzle_solver.domain.services.puzzle import PuzzleService
 
+# Read-only value objects shared by every test: built once at import, so no
+# per-test Fragment validation, and a tuple so nothing can mutate them
+SAMPLE_FRAGMENTS = (
+    Fragment(id=1, index=0, text="Hello"),
+    Fragment(id=2, index=1, text="world"),
+    Fragment(id=3, index=2, text="test"),
+)
+
+# Expectations derived from the sample data so the two cannot drift
+EXPECTED_FULL_TEXT = " ".join(f.text for f in SAMPLE_FRAGMENTS)
+EXPECTED_PARTIAL_TEXT = " ".join(f.text for f in SAMPLE_FRAGMENTS[:2])
+
+
+class StubFragmentService:
+    """Hand-rolled FragmentService stand-in.
+
+    Only what PuzzleService touches: an awaitable discover_fragments and
+    successful_requests. A plain class skips AsyncMock's child-mock
+    creation and call-recording on every attribute access.
+    """
+
+    def __init__(self):
+        self.successful_requests = 5
+        self._return = None
+        self._exc = None
+
+    async def discover_fragments(self, *args, **kwargs):
+        if self._exc is not None:
+            raise self._exc
+        return self._return
+
 
 @pytest.fixture
 def mock_fragment_service():
-    service = AsyncMock()
-    service.successful_requests = 5
-    return service
+    return StubFragmentService()
 
 
-@pytest.fixture
+# Immutable fixtures are built once per module; only mock_fragment_service
+# stays function-scoped because it carries mutable call state
+@pytest.fixture(scope="module")
 def puzzle_config():
-    return PuzzleServiceConfig(stream_threshold=3, chunk_size=2)
+    return PuzzleServiceConfig()
 
 
 @pytest.fixture
+def service(mock_fragment_service, puzzle_config):
+    # One construction point for the service under test; the mock is
+    # function-scoped, so call state never leaks between tests
+    return PuzzleService(mock_fragment_service, puzzle_config)
+
+
+@pytest.fixture(scope="module")
 def sample_fragments():
-    return [
-        Fragment(id=1, index=0, text="Hello"),
-        Fragment(id=2, index=1, text="world"),
-        Fragment(id=3, index=2, text="test"),
-    ]
+    return SAMPLE_FRAGMENTS
 
 
 class TestPuzzleService:
-    def test_initialization(self, mock_fragment_service, puzzle_config):
-        service = PuzzleService(mock_fragment_service, puzzle_config)
+    def test_initialization(self, service, mock_fragment_service, puzzle_config):
         assert service.fragment_service == mock_fragment_service
         assert service.config == puzzle_config
 
     @pytest.mark.asyncio
-    async def test_solve_puzzle_success(self, mock_fragment_service, puzzle_config, sample_fragments):
-        batch = FragmentBatch(fragments=sample_fragments, total_found=3, missing_indices=[])
-        mock_fragment_service.discover_fragments.return_value = batch
-
-        service = PuzzleService(mock_fragment_service, puzzle_config)
-        result = await service.solve_puzzle()
-
-        assert result.puzzle_text == "Hello world test"
-        assert result.elapsed_seconds > 0
-        assert result.stats.total_found == 3
-        assert result.stats.is_complete is True
-
-    @pytest.mark.asyncio
-    async def test_solve_puzzle_no_fragments(self, mock_fragment_service, puzzle_config):
-        batch = FragmentBatch(fragments=[], total_found=0, missing_indices=[])
-        mock_fragment_service.discover_fragments.return_value = batch
+    @pytest.mark.parametrize(
+        ("fragment_count", "side_effect", "expected_text", "expected_complete"),
+        [
+            (3, None, EXPECTED_FULL_TEXT, True),
+            (0, None, "", False),
+            (0, Exception("Test error"), "", False),
+        ],
+        ids=["success", "no_fragments", "exception"],
+    )
+    async def test_solve_puzzle(
+        self,
+        service,
+        mock_fragment_service,
+        sample_fragments,
+        fragment_count,
+        side_effect,
+        expected_text,
+        expected_complete,
+    ):
+        if side_effect is not None:
+            mock_fragment_service._exc = side_effect
+        else:
+            mock_fragment_service._return = FragmentBatch(
+                fragments=sample_fragments[:fragment_count], total_found=fragment_count, missing_indices=[]
+            )
 
-        service = PuzzleService(mock_fragment_service, puzzle_config)
         result = await service.solve_puzzle()
 
-        assert result.puzzle_text == ""
-        assert result.stats.total_found == 0
-        assert result.stats.is_complete is False
-
-    @pytest.mark.asyncio
-    async def test_solve_puzzle_exception(self, mock_fragment_service, puzzle_config):
-        mock_fragment_service.discover_fragments.side_effect = Exception("Test error")
-
-        service = PuzzleService(mock_fragment_service, puzzle_config)
-        result = await service.solve_puzzle()
-
-        assert result.puzzle_text == ""
-        assert result.stats.total_found == 0
-        assert result.stats.is_complete is False
+        assert result.puzzle_text == expected_text
+        assert result.stats.total_found == fragment_count
+        assert result.stats.is_complete is expected_complete
+        if expected_complete:
+            assert result.elapsed_seconds > 0
 
-    def test_assemble_puzzle_text_normal(self, mock_fragment_service, puzzle_config, sample_fragments):
-        service = PuzzleService(mock_fragment_service, puzzle_config)
-        text = service._assemble_puzzle_text(sample_fragments[:2])  # Below threshold
-        assert text == "Hello world"
+    def test_assemble_puzzle_text_partial(self, service, sample_fragments):
+        text = service._assemble_puzzle_text(sample_fragments[:2])
+        assert text == EXPECTED_PARTIAL_TEXT
 
-    def test_assemble_puzzle_text_streaming(self, mock_fragment_service, puzzle_config, sample_fragments):
-        service = PuzzleService(mock_fragment_service, puzzle_config)
-        text = service._assemble_puzzle_text(sample_fragments)  # Above threshold (3)
-        assert text == "Hello world test"
+    def test_assemble_puzzle_text_full(self, service, sample_fragments):
+        text = service._assemble_puzzle_text(sample_fragments)
+        assert text == EXPECTED_FULL_TEXT
 
-    def test_create_success_stats(self, mock_fragment_service, puzzle_config, sample_fragments):
+    def test_create_success_stats(self, service, sample_fragments):
         batch = FragmentBatch(fragments=sample_fragments, total_found=3, missing_indices=[])
-        service = PuzzleService(mock_fragment_service, puzzle_config)
 
         stats = service._create_success_stats(batch, 1.5)
 
@@ -92,8 +119,7 @@ class TestPuzzleService:
         assert stats.time_elapsed == 1.5
         assert stats.fragments_per_second == 2.0
 
-    def test_create_error_result(self, mock_fragment_service, puzzle_config):
-        service = PuzzleService(mock_fragment_service, puzzle_config)
+    def test_create_error_result(self, service):
         result = service._create_error_result("Test error", 1.0)
 
         assert result.puzzle_text == ""